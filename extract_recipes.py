@@ -4,99 +4,451 @@ Recipe Extraction Script
 Extracts recipes from RTF file and converts to JSON format
 """
 
+import hashlib
+import io
+import os
 import re
 import json
 from striprtf.striprtf import rtf_to_text
 from deep_translator import GoogleTranslator
 import time
 
+try:
+    # Much faster JSON serialization when available
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Language-indicator alternations: one compiled scan per text instead of
+# one substring search per indicator. The French scan uses a zero-width
+# lookahead so indicators that share a space ('avec du', 'pour la') are
+# both reported instead of the first one consuming the separator
+_FRENCH_RE = re.compile('(?=(' + '|'.join(re.escape(word) for word in [
+    'de ', ' du ', ' la ', ' le ', ' les ', 'dans ', 'avec ', 'pour ',
+    'cuill', 'grammes', 'oeufs', 'farine', 'sucre', 'beurre', 'lait',
+    'soupe', 'four', 'mélanger', 'ajouter', 'moitié', 'préchauffer'
+]) + '))')
+_SPANISH_RE = re.compile('|'.join(re.escape(word) for word in [
+    'pimentoncitos', 'rellenos', 'queso', 'chorizo español', 'paprika ahumada',
+    'pepas', 'se parten', 'se hierven', 'se cocina', 'se revuelve', 'se llenan'
+]))
+
+
+def _is_french_lower(text_lower):
+    """French check on text that has already been lowercased"""
+    # Two distinct indicators make it French; stop scanning as soon as
+    # the second one shows up
+    seen = set()
+    for match in _FRENCH_RE.finditer(text_lower):
+        seen.add(match.group(1))
+        if len(seen) >= 2:
+            return True
+    return False
+
+
+def _is_spanish_lower(text_lower):
+    """Spanish check on text that has already been lowercased"""
+    return _SPANISH_RE.search(text_lower) is not None
+
 
 def is_french_text(text):
     """Detect if text is primarily in French"""
-    french_indicators = [
-        'de ', ' du ', ' la ', ' le ', ' les ', 'dans ', 'avec ', 'pour ',
-        'cuill', 'grammes', 'oeufs', 'farine', 'sucre', 'beurre', 'lait',
-        'soupe', 'four', 'mélanger', 'ajouter', 'moitié', 'préchauffer'
-    ]
-    text_lower = text.lower()
-    count = sum(1 for indicator in french_indicators if indicator in text_lower)
-    return count >= 2
+    return _is_french_lower(text.lower())
 
 
 def is_spanish_text(text):
     """Detect if text is primarily in Spanish"""
-    spanish_indicators = [
-        'pimentoncitos', 'rellenos', 'queso', 'chorizo español', 'paprika ahumada',
-        'pepas', 'se parten', 'se hierven', 'se cocina', 'se revuelve', 'se llenan'
-    ]
+    return _is_spanish_lower(text.lower())
+
+
+# Maximum characters the translation API accepts per request
+_TRANSLATE_CHAR_LIMIT = 4500
+
+# Shared translator instance: constructed once, reused for every request
+_FR_EN = GoogleTranslator(source='fr', target='en')
+
+# Precompiled patterns for the per-line parsing loops
+_SERVING_PATTERN = r'(For|Makes|Serves|Pour)\s+\d+'  # Serving sizes
+_SERVING_RE = re.compile('^' + _SERVING_PATTERN, re.IGNORECASE)
+# Single alternation covering all the non-recipe patterns to skip: serving
+# sizes, section headers, and numbered lists (URLs are caught by a cheap
+# prefix test before the regex runs)
+_SKIP_RE = re.compile(
+    '^(?:' + _SERVING_PATTERN +
+    r'|(?:Ingredients?|Instructions?|Toppings?|Modifications?|Source|Preparation|Method)\s*:?$'
+    r'|\d+[\.\)]\s)',
+    re.IGNORECASE
+)
+# Lines starting with these verbs are instructions, not titles
+_ACTION_STARTS = frozenset([
+    'Add', 'Mix', 'Cook', 'Bake', 'Heat', 'Serve', 'Pour', 'Remove',
+    'Stir', 'Blend', 'Boil', 'Simmer'
+])
+# Verbs anywhere in a line mark it as an instruction; one alternation
+# scan per line replaces forty-odd separate substring searches, keeping
+# the same substring semantics (so inflections like 'added' still match)
+_ACTION_VERB_RE = re.compile('|'.join([
+    'mix', 'add', 'cook', 'bake', 'preheat', 'heat', 'serve', 'pour', 'place',
+    'remove', 'stir', 'blend', 'boil', 'simmer', 'grill', 'fry', 'melt',
+    'whisk', 'combine', 'prepare', 'sauté', 'marinate', 'bring', 'reduce',
+    'brown', 'chop', 'dice', 'slice', 'mince', 'fold', 'spread', 'layer',
+    'oven', 'bake', 'roast', 'toast',
+    'chauffez', 'ajoutez', 'mélangez', 'faites', 'laissez', 'couvrez',
+    'pelez', 'coupez', 'versez', 'préchauffer', 'enfourner'
+]))
+# Tokens that carry no translatable meaning: quantities, fractions, and
+# common unit abbreviations
+_UNIT_TOKEN_RE = re.compile(r'^(?:[\d./,x×*°%()+-]+|g|kg|mg|ml|cl|dl|l|cm|mm|min|h|c|°c)\.?$')
+# Leading bullet characters stripped from lines; a plain lstrip over
+# this set is cheaper than running the regex engine per line
+_BULLET_CHARS = '•‣⁃⁌⁍∙◉◘◦☙❥❧⦾⦿-•◦'
+_NUMLIST_RE = re.compile(r'^\d+\.?\d*\s')
+
+
+def _should_translate(text):
+    """Skip segments that are empty, Spanish, very short, or already English"""
+    if not text or len(text.strip()) == 0:
+        return False
+
+    # Lowercase once for both language checks
     text_lower = text.lower()
-    return any(indicator in text_lower for indicator in spanish_indicators)
 
-
-def translate_text(text, keep_dish_names=True):
-    """Translate French text to English while preserving food names"""
-    if not text or len(text.strip()) == 0:
-        return text
+    # Quantity-only segments ("250 g", "1/2 l") have nothing to translate
+    tokens = text_lower.split()
+    if tokens and all(_UNIT_TOKEN_RE.match(token) for token in tokens):
+        return False
 
     # Don't translate if it's Spanish
-    if is_spanish_text(text):
-        return text
+    if _is_spanish_lower(text_lower):
+        return False
 
     # Don't translate if it's already English or very short
-    if not is_french_text(text) or len(text) < 10:
-        return text
+    if not _is_french_lower(text_lower) or len(text) < 10:
+        return False
+
+    return True
+
+
+def _split_long_text(text, limit=_TRANSLATE_CHAR_LIMIT):
+    """Split long text into chunks of at most `limit` chars
+
+    Prefers sentence boundaries, falls back to word boundaries inside an
+    oversized sentence, and hard-slices unbroken runs longer than the
+    limit so no chunk can ever exceed it. Sentence-final pieces keep
+    their period, so joining the translated chunks back with spaces
+    preserves the original punctuation instead of inventing periods at
+    word-boundary splits.
+    """
+    sentences = text.split('. ')
+    pieces = []
+    for s_idx, sentence in enumerate(sentences):
+        if not sentence.strip():
+            continue
+        # split('. ') removed this sentence's period; keep it on the piece
+        tail = '.' if s_idx < len(sentences) - 1 else ''
+        if len(sentence) + len(tail) <= limit:
+            pieces.append(sentence + tail)
+            continue
+
+        # Sentence alone exceeds the limit: break it between words,
+        # leaving room for the period kept with the final fragment
+        budget = limit - 1
+        current = ''
+        for word in sentence.split(' '):
+            # Hard-slice pathological unbroken runs longer than the limit
+            while len(word) > budget:
+                if current:
+                    pieces.append(current)
+                    current = ''
+                pieces.append(word[:budget])
+                word = word[budget:]
+            if current and len(current) + 1 + len(word) > budget:
+                pieces.append(current)
+                current = word
+            elif current:
+                current = current + ' ' + word
+            else:
+                current = word
+        if current or tail:
+            pieces.append(current + tail)
+
+    # Pack pieces greedily so each chunk carries as much as the API
+    # allows, instead of one request per sentence
+    chunks = []
+    current = ''
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > limit:
+            chunks.append(current)
+            current = piece
+        elif current:
+            current = current + ' ' + piece
+        else:
+            current = piece
+    if current:
+        chunks.append(current)
+
+    return chunks
+
 
+# On-disk cache of past translations, keyed by a hash of the source text,
+# so repeated runs only pay for text they have not seen before
+_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.translation_cache.json')
+
+
+def _cache_key(text):
+    """Stable cache key for a source segment"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _load_translation_cache():
+    """Load previously saved translations, if any"""
     try:
-        translator = GoogleTranslator(source='fr', target='en')
-        # API rate limiting
-        time.sleep(0.5)
+        with open(_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-        # Split by sentences to handle long text
-        if len(text) > 4500:
-            sentences = text.split('. ')
-            translated = []
-            for sentence in sentences:
-                if sentence.strip() and len(sentence) > 5:
-                    trans = translator.translate(sentence[:4500])
-                    translated.append(trans)
-                    time.sleep(0.5)
-            return '. '.join(translated)
-        else:
-            return translator.translate(text)
+
+def _save_translation_cache(cache):
+    """Persist the translation cache for future runs"""
+    try:
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"  Could not save translation cache: {e}")
+
+
+# Delimiter used to pack many segments into one translate() call; chosen
+# so the API returns it unchanged and it never appears in recipe text
+_BATCH_DELIMITER = '\n@@@\n'
+
+
+def _translate_batch(batch):
+    """Translate one group of segments with a single API request
+
+    The segments are joined with a rare delimiter, sent as one document,
+    and split back apart (deep_translator's own translate_batch is just
+    a per-item loop, one request per segment). If the delimiter does not
+    survive the round trip, the segments are retried one at a time with
+    the usual pause between requests. Returns None if the group call
+    failed outright.
+    """
+    # API rate limiting: one pause per HTTP request
+    time.sleep(0.5)
+    try:
+        translated = _FR_EN.translate(_BATCH_DELIMITER.join(batch))
     except Exception as e:
         print(f"  Translation error: {e}")
-        return text
+        return None
+
+    parts = [part.strip() for part in translated.split('@@@')] if translated else []
+    if len(parts) == len(batch):
+        return parts
 
+    # Delimiter was mangled by the API; fall back to one request per
+    # segment, keeping the rate-limit pause before each one
+    results = []
+    for text in batch:
+        time.sleep(0.5)
+        try:
+            results.append(_FR_EN.translate(text))
+        except Exception as e:
+            print(f"  Translation error: {e}")
+            results.append(None)
+    return results
+
+
+def _scatter_batch(batch, positions, results, cache):
+    """Translate one batch, storing successes in the results and cache"""
+    translated = _translate_batch(batch)
+    for i, pos in enumerate(positions):
+        trans = translated[i] if translated and translated[i] else None
+        if trans is not None:
+            results[pos] = trans
+            cache[_cache_key(batch[i])] = trans
+        else:
+            # Failed segments fall back to the original text, uncached
+            results[pos] = batch[i]
+
+
+def translate_segments(texts):
+    """Translate a list of French strings, packing many segments per API call
+
+    Previously translated segments are served from the on-disk cache and
+    never re-sent to the API.
+    """
+    cache = _load_translation_cache()
+    results = [None] * len(texts)
+
+    pending = []
+    for pos, text in enumerate(texts):
+        cached = cache.get(_cache_key(text))
+        if cached is not None:
+            results[pos] = cached
+        else:
+            pending.append(pos)
+
+    if pending:
+        print(f"  {len(pending)} segments to translate ({len(texts) - len(pending)} cached)...")
+
+    batch = []
+    positions = []
+    batch_chars = 0
+    for pos in pending:
+        text = texts[pos]
+        if batch and batch_chars + len(_BATCH_DELIMITER) + len(text) > _TRANSLATE_CHAR_LIMIT:
+            _scatter_batch(batch, positions, results, cache)
+            batch = []
+            positions = []
+            batch_chars = 0
+        if batch:
+            batch_chars += len(_BATCH_DELIMITER)
+        batch.append(text)
+        positions.append(pos)
+        batch_chars += len(text)
+
+    if batch:
+        _scatter_batch(batch, positions, results, cache)
+
+    if pending:
+        _save_translation_cache(cache)
+
+    return results
+
+
+def translate_recipes(recipes):
+    """Translate French recipes in place, batching segments across all recipes"""
+    targets = []  # (recipe index, field, position within field)
+    texts = []
+
+    for idx, recipe in enumerate(recipes):
+        # Determine if this is a French recipe (to translate)
+        # A bounded sample is plenty for language detection: the title,
+        # the first few ingredients (truncated), and the start of the
+        # instructions, built with one join
+        sample_parts = [recipe['title']]
+        sample_parts.extend(ing[:80] for ing in recipe['ingredients'][:5])
+        sample_parts.append(recipe['instructions'][:200])
+        content_sample = ' '.join(sample_parts).lower()
+        if not _is_french_lower(content_sample) or _is_spanish_lower(content_sample):
+            continue
 
-def guess_category(title, ingredients, instructions):
+        print(f"  Translating from French: {recipe['title']}")
+
+        for sub_idx, ing in enumerate(recipe['ingredients']):
+            if _should_translate(ing):
+                targets.append((idx, 'ingredients', sub_idx))
+                texts.append(ing)
+
+        for field in ('instructions', 'notes'):
+            value = recipe[field]
+            if not _should_translate(value):
+                continue
+            if len(value) > _TRANSLATE_CHAR_LIMIT:
+                for chunk in _split_long_text(value):
+                    targets.append((idx, field, None))
+                    texts.append(chunk)
+            else:
+                targets.append((idx, field, None))
+                texts.append(value)
+
+    if not texts:
+        return
+
+    translated = translate_segments(texts)
+
+    # Scatter results back, re-joining chunks of long fields in order
+    pieces = {}
+    for target, text in zip(targets, translated):
+        pieces.setdefault(target, []).append(text)
+
+    for (idx, field, sub_idx), parts in pieces.items():
+        # Chunks carry their own sentence punctuation, so a plain space
+        # separator reassembles long fields without adding periods
+        value = ' '.join(parts) if len(parts) > 1 else parts[0]
+        if sub_idx is None:
+            recipes[idx][field] = value
+        else:
+            recipes[idx][field][sub_idx] = value
+
+
+def _keyword_scanner(*word_groups):
+    """Compile a regex that finds every keyword in the groups in one pass
+
+    The zero-width lookahead reports overlapping hits (e.g. 'cake' inside
+    'pancakes'), so the scan keeps the semantics of per-word substring
+    tests while walking the content only once.
+    """
+    words = sorted({word for group in word_groups for word in group}, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(re.escape(word) for word in words) + '))')
+
+
+# Keyword groups for category guessing; each scan collects every hit in a
+# single pass, and the checks below are plain set intersections
+_DESSERT_TITLE = frozenset(['cookie', 'cake', 'bread', 'waffle', 'pancake', 'granola', 'clafoutis', 'tarte', 'ice cream', 'glace', 'pudding'])
+_SALAD_TITLE = frozenset(['salad', 'salade'])
+_SOUP_TITLE = frozenset(['soup', 'soupe', 'pho', 'dal'])
+_SAUCE_TITLE = frozenset(['sauce', 'dressing', 'glaze', 'aioli', 'hummus', 'guac', 'chutney', 'tahini', 'jam', 'confit', 'vinaigrette', 'aji', 'chimichurri'])
+_MEAT_WORDS = frozenset(['beef', 'pork', 'lamb', 'ribs', 'boeuf', 'poulet', 'chicken', 'stroganoff', 'meatball', 'meat'])
+_FISH_WORDS = frozenset(['fish', 'salmon', 'ceviche', 'prawn', 'seafood'])
+_BREAKFAST_TITLE = frozenset(['breakfast', 'chia'])
+_MAIN_TITLE = frozenset(['lasagna', 'moussaka', 'pasta', 'rice', 'couscous', 'tajine', 'enchiladas', 'bulgogi', 'pho', 'bo-bun'])
+
+_TITLE_SCAN = _keyword_scanner(_DESSERT_TITLE, _SALAD_TITLE, _SOUP_TITLE, _SAUCE_TITLE, _BREAKFAST_TITLE, _MAIN_TITLE)
+_CONTENT_SCAN = _keyword_scanner(_MEAT_WORDS, _FISH_WORDS)
+
+# Keyword groups for tag extraction, all folded into one content scan
+_VEGETARIAN_WORDS = frozenset(['vegetarian', 'veggie', 'vegan'])
+_KETO_WORDS = frozenset(['keto', 'low-carb', 'low carb'])
+_GLUTEN_FREE_WORDS = frozenset(['gluten-free', 'gluten free'])
+_DAIRY_FREE_WORDS = frozenset(['dairy-free', 'dairy free'])
+_THAI_VIET_WORDS = frozenset(['thai', 'pho', 'bo-bun', 'bo bun', 'cambodian', 'vietnamese'])
+_ITALIAN_WORDS = frozenset(['italian', 'pasta', 'lasagna', 'moussaka', 'parmigiana', 'bolognese'])
+_MEXICAN_WORDS = frozenset(['mexican', 'enchiladas', 'guac', 'ceviche', 'aji', 'latin', 'chimichurri'])
+_FRENCH_TAG_WORDS = frozenset(['french', 'clafoutis', 'tarte', 'blini'])
+_MIDDLE_EASTERN_WORDS = frozenset(['middle eastern', 'hummus', 'tahini', 'shakshuka', 'taboul', 'couscous', 'tajine', 'falafel'])
+_ASIAN_WORDS = frozenset(['asian', 'japanese', 'korean', 'szechuan', 'sichuan', 'miso', 'bulgogi', 'shoyu'])
+_INDIAN_WORDS = frozenset(['indian', 'curry', 'dal'])
+_BREAKFAST_MEAL_WORDS = frozenset(['breakfast', 'waffle', 'pancake'])
+_DESSERT_MEAL_WORDS = frozenset(['dessert', 'cookie', 'cake'])
+_SOURCE_WORDS = frozenset(['ottolenghi', 'jamie oliver', 'new york times'])
+
+_TAG_SCAN = _keyword_scanner(
+    _VEGETARIAN_WORDS, _KETO_WORDS, _GLUTEN_FREE_WORDS, _DAIRY_FREE_WORDS,
+    _THAI_VIET_WORDS, _ITALIAN_WORDS, _MEXICAN_WORDS, _FRENCH_TAG_WORDS,
+    _MIDDLE_EASTERN_WORDS, _ASIAN_WORDS, _INDIAN_WORDS,
+    _BREAKFAST_MEAL_WORDS, _DESSERT_MEAL_WORDS, _SOURCE_WORDS,
+)
+
+
+def guess_category(title_lower, content):
     """Guess recipe category based on content"""
-    title_lower = title.lower()
-    content = (title + " " + " ".join(ingredients) + " " + instructions).lower()
+    title_words = set(_TITLE_SCAN.findall(title_lower))
+    content_words = set(_CONTENT_SCAN.findall(content))
 
-    if any(word in title_lower for word in ['cookie', 'cake', 'bread', 'waffle', 'pancake', 'granola', 'clafoutis', 'tarte', 'ice cream', 'glace', 'pudding']):
+    if title_words & _DESSERT_TITLE:
         return "Dessert"
-    elif any(word in title_lower for word in ['salad', 'salade']):
+    elif title_words & _SALAD_TITLE:
         return "Salad"
-    elif any(word in title_lower for word in ['soup', 'soupe', 'pho', 'dal']):
+    elif title_words & _SOUP_TITLE:
         return "Soup"
-    elif any(word in title_lower for word in ['sauce', 'dressing', 'glaze', 'aioli', 'hummus', 'guac', 'chutney', 'tahini', 'jam', 'confit', 'vinaigrette', 'aji', 'chimichurri']):
+    elif title_words & _SAUCE_TITLE:
         return "Sauce/Condiment"
-    elif any(word in content for word in ['beef', 'pork', 'lamb', 'ribs', 'boeuf', 'poulet', 'chicken', 'stroganoff', 'meatball', 'meat']):
+    elif content_words & _MEAT_WORDS:
         return "Main"
-    elif any(word in content for word in ['fish', 'salmon', 'ceviche', 'prawn', 'seafood']):
+    elif content_words & _FISH_WORDS:
         return "Main"
-    elif any(word in title_lower for word in ['breakfast', 'chia']):
+    elif title_words & _BREAKFAST_TITLE:
         return "Breakfast"
-    elif any(word in title_lower for word in ['lasagna', 'moussaka', 'pasta', 'rice', 'couscous', 'tajine', 'enchiladas', 'bulgogi', 'pho', 'bo-bun']):
+    elif title_words & _MAIN_TITLE:
         return "Main"
     else:
         return "Side"
 
 
-def extract_tags(title, ingredients, instructions, notes):
+def extract_tags(title_lower, content):
     """Extract tags for categorization"""
-    content = (title + " " + " ".join(ingredients) + " " + instructions + " " + notes).lower()
-
     tags = {
         "type": [],
         "region": [],
@@ -104,65 +456,63 @@ def extract_tags(title, ingredients, instructions, notes):
         "source": []
     }
 
+    # One pass over the content collects every keyword hit
+    found = set(_TAG_SCAN.findall(content))
+
     # Type tags
-    if any(word in content for word in ['vegetarian', 'veggie', 'vegan']) or 'veggie' in title.lower():
+    if found & _VEGETARIAN_WORDS or 'veggie' in title_lower:
         tags["type"].append("vegetarian")
-    if any(word in content for word in ['keto', 'low-carb', 'low carb']):
+    if found & _KETO_WORDS:
         tags["type"].append("keto")
-    if any(word in content for word in ['gluten-free', 'gluten free']):
+    if found & _GLUTEN_FREE_WORDS:
         tags["type"].append("gluten-free")
-    if any(word in content for word in ['dairy-free', 'dairy free']):
+    if found & _DAIRY_FREE_WORDS:
         tags["type"].append("dairy-free")
 
     # Region tags
-    if any(word in content for word in ['thai', 'pho', 'bo-bun', 'bo bun', 'cambodian', 'vietnamese']):
+    if found & _THAI_VIET_WORDS:
         tags["region"].append("Thai/Vietnamese")
-    if any(word in content for word in ['italian', 'pasta', 'lasagna', 'moussaka', 'parmigiana', 'bolognese']):
+    if found & _ITALIAN_WORDS:
         tags["region"].append("Italian")
-    if any(word in content for word in ['mexican', 'enchiladas', 'guac', 'ceviche', 'aji', 'latin', 'chimichurri']):
+    if found & _MEXICAN_WORDS:
         tags["region"].append("Mexican/Latin")
-    if any(word in content for word in ['french', 'clafoutis', 'tarte', 'blini']):
+    if found & _FRENCH_TAG_WORDS:
         tags["region"].append("French")
-    if any(word in content for word in ['middle eastern', 'hummus', 'tahini', 'shakshuka', 'taboul', 'couscous', 'tajine', 'falafel']):
+    if found & _MIDDLE_EASTERN_WORDS:
         tags["region"].append("Middle Eastern")
-    if any(word in content for word in ['asian', 'japanese', 'korean', 'szechuan', 'sichuan', 'miso', 'bulgogi', 'shoyu']):
+    if found & _ASIAN_WORDS:
         tags["region"].append("Asian")
-    if any(word in content for word in ['ottolenghi']):
+    if 'ottolenghi' in found:
         tags["region"].append("Middle Eastern")
-    if any(word in content for word in ['indian', 'curry', 'dal']):
+    if found & _INDIAN_WORDS:
         tags["region"].append("Indian")
 
     # Meal tags
-    if any(word in content for word in ['breakfast', 'waffle', 'pancake']):
+    if found & _BREAKFAST_MEAL_WORDS:
         tags["meal"].append("breakfast")
-    if any(word in content for word in ['dessert', 'cookie', 'cake']):
+    if found & _DESSERT_MEAL_WORDS:
         tags["meal"].append("dessert")
 
     # Source tags
-    if 'ottolenghi' in content:
+    if 'ottolenghi' in found:
         tags["source"].append("Ottolenghi")
-    if 'jamie oliver' in content:
+    if 'jamie oliver' in found:
         tags["source"].append("Jamie Oliver")
-    if 'new york times' in content:
+    if 'new york times' in found:
         tags["source"].append("New York Times")
 
     return tags
 
 
-def is_recipe_title(line):
+def is_recipe_title(line, line_lower):
     """Determine if a line is likely a recipe title"""
+    # Reject URLs with cheap prefix tests before touching the regex engine
+    if line.startswith(('http://', 'https://', 'www.')):
+        return False
+
     # Skip common non-recipe patterns
-    skip_patterns = [
-        r'^(For|Makes|Serves|Pour)\s+\d+',  # Serving sizes
-        r'^(Ingredients?|Instructions?|Toppings?|Modifications?|Source|Preparation|Method)\s*:?$',  # Section headers
-        r'^https?://',  # URLs
-        r'^www\.',  # URLs
-        r'^\d+[\.\)]\s',  # Numbered lists
-    ]
-
-    for pattern in skip_patterns:
-        if re.match(pattern, line, re.IGNORECASE):
-            return False
+    if _SKIP_RE.match(line):
+        return False
 
     # Recipe title patterns
     if line.endswith(':'):
@@ -171,167 +521,109 @@ def is_recipe_title(line):
     # Title-like patterns (proper case, reasonable length, no action verbs at start)
     if len(line) > 5 and len(line) < 100:
         # Check if it starts with capital letter and doesn't start with common ingredient amounts
-        if line[0].isupper() and not re.match(r'^\d+\.?\d*\s', line):
+        if line[0].isupper() and not _NUMLIST_RE.match(line):
             # Doesn't start with action verbs
-            action_starts = ['Add', 'Mix', 'Cook', 'Bake', 'Heat', 'Serve', 'Pour', 'Remove', 'Stir', 'Blend', 'Boil', 'Simmer']
-            if not any(line.startswith(verb) for verb in action_starts):
+            if line.split(' ', 1)[0] not in _ACTION_STARTS:
                 # Contains recipe-like words or is a proper dish name
                 recipe_indicators = ['cake', 'bread', 'soup', 'salad', 'sauce', 'chicken', 'beef', 'pork', 'fish']
-                if any(indicator in line.lower() for indicator in recipe_indicators):
+                if any(indicator in line_lower for indicator in recipe_indicators):
                     return True
 
     return False
 
 
-def parse_recipes_from_text(text):
-    """Parse recipes from plain text"""
-    recipes = []
-    lines = text.split('\n')
-
-    # Clean lines
-    cleaned_lines = []
-    for line in lines:
+def _iter_clean_lines(text):
+    """Yield stripped, bullet-free, non-empty lines one at a time"""
+    for line in io.StringIO(text):
         line = line.strip()
         # Remove bullet points
-        line = re.sub(r'^[\u2022\u2023\u2043\u204C\u204D\u2219\u25C9\u25D8\u25E6\u2619\u2765\u2767\u29BE\u29BF\-•◦]+\s*', '', line)
+        line = line.lstrip(_BULLET_CHARS).lstrip()
         if line:
-            cleaned_lines.append(line)
+            yield line
 
-    lines = cleaned_lines
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+def parse_recipes_from_text(text):
+    """Parse recipes from plain text"""
+    recipes = []
+    recipe = None
+    instruction_parts = []
+    note_parts = []
+
+    def finish_recipe():
+        if recipe is None:
+            return
+        recipe['instructions'] = ' '.join(instruction_parts)
+        recipe['notes'] = ' '.join(note_parts)
+        # Only add if it has substantive content
+        if len(recipe['ingredients']) > 0 or len(recipe['instructions']) > 50:
+            recipes.append(recipe)
+
+    prev_line = ''
+    for i, line in enumerate(_iter_clean_lines(text)):
+        # Lowercase each line once for every check below
+        line_lower = line.lower()
 
         # Skip header and reference URLs at the start
-        if 'OUR RECIPES' in line or (i < 10 and line.startswith('http') and len(lines[i-1] if i > 0 else '') < 5):
-            i += 1
+        if recipe is None and ('OUR RECIPES' in line or (i < 10 and line.startswith('http') and len(prev_line) < 5)):
+            prev_line = line
             continue
 
-        # Check if this is a recipe title
-        if is_recipe_title(line):
-            title = line.rstrip(':').strip()
-
-            # Start collecting recipe
+        # A title line closes the current recipe and starts the next one
+        if is_recipe_title(line, line_lower):
+            finish_recipe()
             recipe = {
-                'title': title,
+                'title': line.rstrip(':').strip(),
                 'ingredients': [],
                 'instructions': '',
                 'notes': ''
             }
-
-            i += 1
             instruction_parts = []
+            note_parts = []
 
-            # Collect recipe content until next recipe or end
-            while i < len(lines):
-                line = lines[i]
-
-                # Check if we hit the next recipe title
-                if is_recipe_title(line):
-                    # Don't consume this line, it's the next recipe
-                    break
-
-                # URLs and web references go to notes
-                if 'http' in line or 'www.' in line:
-                    recipe['notes'] += line + ' '
-                    i += 1
-                    continue
-
-                # Check for "we found this recipe" or similar notes
-                if any(phrase in line.lower() for phrase in ['we found', 'we learned', 'source:', 'recipe from', 'our favorite']):
-                    recipe['notes'] += line + ' '
-                    i += 1
-                    continue
-
-                # Serving size info (e.g., "For 4 people", "Makes 6")
-                if re.match(r'^(For|Makes|Serves|Pour)\s+\d+', line, re.IGNORECASE):
-                    recipe['notes'] += line + ' '
-                    i += 1
-                    continue
-
-                # Check if it's an instruction line (contains action verbs)
-                action_verbs = ['mix', 'add', 'cook', 'bake', 'preheat', 'heat', 'serve', 'pour', 'place',
-                                'remove', 'stir', 'blend', 'boil', 'simmer', 'grill', 'fry', 'melt',
-                                'whisk', 'combine', 'prepare', 'sauté', 'marinate', 'bring', 'reduce',
-                                'brown', 'chop', 'dice', 'slice', 'mince', 'fold', 'spread', 'layer',
-                                'oven', 'bake', 'roast', 'toast',
-                                'chauffez', 'ajoutez', 'mélangez', 'faites', 'laissez', 'couvrez',
-                                'pelez', 'coupez', 'versez', 'préchauffer', 'enfourner']
-
-                is_instruction = any(verb in line.lower() for verb in action_verbs)
-
-                if is_instruction:
-                    instruction_parts.append(line)
-                else:
-                    # It's likely an ingredient
-                    recipe['ingredients'].append(line)
-
-                i += 1
-
-            recipe['instructions'] = ' '.join(instruction_parts)
-
-            # Only add if it has substantive content
-            if len(recipe['ingredients']) > 0 or len(recipe['instructions']) > 50:
-                recipes.append(recipe)
+        elif recipe is not None:
+            # URLs and web references go to notes
+            if 'http' in line or 'www.' in line:
+                note_parts.append(line)
 
-        else:
-            i += 1
+            # Check for "we found this recipe" or similar notes
+            elif any(phrase in line_lower for phrase in ['we found', 'we learned', 'source:', 'recipe from', 'our favorite']):
+                note_parts.append(line)
+
+            # Serving size info (e.g., "For 4 people", "Makes 6")
+            elif _SERVING_RE.match(line):
+                note_parts.append(line)
+
+            # Instruction lines contain action verbs; the rest are ingredients
+            elif _ACTION_VERB_RE.search(line_lower):
+                instruction_parts.append(line)
+            else:
+                recipe['ingredients'].append(line)
 
+        prev_line = line
+
+    finish_recipe()
     return recipes
 
 
 def format_recipe(recipe_data):
     """Format a single recipe for JSON output"""
     title = recipe_data['title']
-    ingredients_raw = recipe_data['ingredients']
-    instructions_raw = recipe_data['instructions']
-    notes_raw = recipe_data['notes']
-
-    # Determine if this is a French recipe (to translate)
-    content_sample = title + ' ' + ' '.join(ingredients_raw[:5]) + ' ' + instructions_raw[:200]
-    is_french = is_french_text(content_sample)
-    is_spanish = is_spanish_text(content_sample)
-
-    # Translate if needed (but keep title if it's a French dish name)
-    if is_french and not is_spanish:
-        print(f"  Translating from French...")
-        ingredients = []
-        for ing in ingredients_raw:
-            if ing.strip():
-                try:
-                    translated = translate_text(ing, keep_dish_names=True)
-                    ingredients.append(translated)
-                except Exception as e:
-                    print(f"    Error translating ingredient: {e}")
-                    ingredients.append(ing)
-
-        try:
-            instructions = translate_text(instructions_raw, keep_dish_names=True)
-        except Exception as e:
-            print(f"    Error translating instructions: {e}")
-            instructions = instructions_raw
-
-        try:
-            notes = translate_text(notes_raw, keep_dish_names=True) if notes_raw else ""
-        except Exception as e:
-            print(f"    Error translating notes: {e}")
-            notes = notes_raw
-    else:
-        ingredients = ingredients_raw
-        instructions = instructions_raw
-        notes = notes_raw
 
     # Clean up
-    ingredients = [ing.strip() for ing in ingredients if ing.strip()]
-    instructions = instructions.strip()
-    notes = notes.strip()
+    ingredients = [ing.strip() for ing in recipe_data['ingredients'] if ing.strip()]
+    instructions = recipe_data['instructions'].strip()
+    notes = recipe_data['notes'].strip()
+
+    # Lowercase the title and content once and share them between the
+    # category and tag passes
+    title_lower = title.lower()
+    content = (title + " " + " ".join(ingredients) + " " + instructions + " " + notes).lower()
 
     # Guess category
-    category = guess_category(title, ingredients, instructions)
+    category = guess_category(title_lower, content)
 
     # Extract tags
-    tags = extract_tags(title, ingredients, instructions, notes)
+    tags = extract_tags(title_lower, content)
 
     return {
         "title": title,
@@ -343,28 +635,65 @@ def format_recipe(recipe_data):
     }
 
 
+def _dump_recipe(recipe):
+    """Serialize one recipe to pretty-printed JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(recipe, option=orjson.OPT_INDENT_2)
+    return json.dumps(recipe, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_recipes_json(recipes, path):
+    """Stream the recipe list to disk as pretty-printed JSON
+
+    Recipes are serialized and written one at a time, so peak memory
+    stays at one recipe's worth of JSON instead of the whole document.
+    Uses orjson when it is installed, falling back to stdlib json.
+    """
+    with open(path, 'wb') as f:
+        if not recipes:
+            f.write(b'[]')
+            return
+        f.write(b'[')
+        for i, recipe in enumerate(recipes):
+            f.write(b',\n' if i else b'\n')
+            # Indent the item so it nests inside the top-level array
+            f.write(b'  ' + _dump_recipe(recipe).replace(b'\n', b'\n  '))
+        f.write(b'\n]')
+
+
+def load_recipe_text(path):
+    """Read the RTF file and convert it to plain text
+
+    striprtf needs the whole document in memory to resolve control
+    groups, so keep the raw RTF buffer local to this function and let it
+    be freed as soon as the plain text is extracted.
+    """
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return rtf_to_text(f.read())
+
+
 def main():
     input_file = "/Users/dea3/Desktop/Dev/Claude Code tests/Recipes app /our_recipes.rtf"
     output_file = "/Users/dea3/Desktop/Dev/Claude Code tests/Recipes app /recipes_import.json"
 
     print("Starting recipe extraction...")
 
-    # Read RTF file
+    # Read RTF file and convert to text
     print("Reading RTF file...")
-    with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
-        rtf_content = f.read()
-
-    # Convert RTF to text
-    print("Converting RTF to plain text...")
-    text = rtf_to_text(rtf_content)
+    text = load_recipe_text(input_file)
 
     # Parse recipes
     print("Parsing recipes...")
     recipes_raw = parse_recipes_from_text(text)
     print(f"Found {len(recipes_raw)} recipes")
 
-    # Format recipes
-    print("\nFormatting and translating recipes...")
+    # Translate French recipes in bulk before formatting
+    print("\nTranslating French recipes...")
+    translate_recipes(recipes_raw)
+
+    # Format recipes; with translation already batched up front this is
+    # pure CPU work, so a plain loop beats thread-pool overhead
+    print("\nFormatting recipes...")
     recipes_formatted = []
     for i, recipe in enumerate(recipes_raw):
         print(f"[{i+1}/{len(recipes_raw)}] {recipe['title']}")
@@ -379,8 +708,7 @@ def main():
 
     # Save to JSON
     print(f"\nSaving {len(recipes_formatted)} recipes to JSON...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(recipes_formatted, f, indent=2, ensure_ascii=False)
+    write_recipes_json(recipes_formatted, output_file)
 
     print(f"\nDone! Saved to {output_file}")
     print(f"Total recipes: {len(recipes_formatted)}")